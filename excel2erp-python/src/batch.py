@@ -0,0 +1,108 @@
+"""
+Batch Processing - Converting Many Workbooks at Once
+
+This module runs the complete Excel2ERP pipeline (extract → generate → ZIP)
+on workbook files without any user interface, and spreads many workbooks
+across CPU cores.
+
+ARCHITECTURAL CONTEXT:
+----------------------
+It sits beside the GUI and the web app as a third front end over the same
+domain functions:
+
+    excel2erp.py (GUI)    flask-excel2erp.py (web)    batch.py (this module)
+              │                     │                          │
+              └─────────────────────┼──────────────────────────┘
+                                    ▼
+                        engine.py + excel.py (domain)
+
+WHY PROCESSES:
+--------------
+Each workbook is independent, and the work is CPU-bound (XML parsing inside
+openpyxl, or calamine's decoding, plus string formatting), so threads would
+serialize on the GIL. process_workbook() takes only picklable arguments (a
+path, the frozen Config, plain strings) and opens the workbook itself, so it
+can run in a worker process unchanged.
+
+USER INPUT:
+-----------
+Fields that the GUI would prompt for (see engine.missing_properties()) are
+passed as a plain dict. Date fields are normalized with normalize_date(),
+just like the interactive front ends do.
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable
+
+from model import Config
+from excel import open_sheet
+from engine import extract_header, iter_detail, missing_properties, normalize_date, write_zip
+
+
+def process_workbook(path: str | os.PathLike, config: Config, source_name: str,
+                     user_inputs: dict[str, str] | None = None) -> bytes:
+    """
+    Convert one workbook into the ERP import ZIP.
+
+    Args:
+        path: Path to the .xlsx file.
+        config: The loaded Config.
+        source_name: Name of the Source describing the workbook's layout.
+        user_inputs: Values for the header fields a user would otherwise be
+                     prompted for; absent fields are left empty.
+
+    Returns:
+        The ZIP archive bytes, identical to what the GUI would save.
+
+    Raises:
+        KeyError: If no source is named source_name.
+    """
+    source = next((s for s in config.sources if s.name == source_name), None)
+    if source is None:
+        raise KeyError(source_name)
+    user_inputs = user_inputs or {}
+
+    buffer = io.BytesIO()
+    with open_sheet(path, source.sheet_index) as sheet:
+        header_data = extract_header(sheet, source, config.result.header)
+
+        # Merge user-provided fields the same way the GUI and web app do
+        for prop in missing_properties(source, config.result.header):
+            value = user_inputs.get(prop.name, "")
+            if prop.type == "date":
+                value = normalize_date(value)
+            header_data[prop.name] = value
+
+        header_data["sourceName"] = source.name
+
+        # Detail rows go straight from the sheet into the ZIP entry; no
+        # list of row dicts is built
+        write_zip(buffer, config.result, [header_data], iter_detail(sheet, source))
+    return buffer.getvalue()
+
+
+def process_workbooks(paths: Iterable[str | os.PathLike], config: Config, source_name: str,
+                      user_inputs: dict[str, str] | None = None,
+                      max_workers: int | None = None) -> list[bytes]:
+    """
+    Convert many workbooks in parallel, one worker process per CPU by default.
+
+    Args:
+        paths: Paths to the .xlsx files, all laid out as source_name.
+        config: The loaded Config (pickled once per workbook to the workers).
+        source_name: Name of the Source shared by all workbooks.
+        user_inputs: Header field values applied to every workbook.
+        max_workers: Worker process count; None lets the executor decide.
+
+    Returns:
+        The ZIP bytes for each path, in the same order as paths.
+        The first failing workbook's exception is re-raised.
+    """
+    paths = list(paths)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            process_workbook, paths, repeat(config), repeat(source_name), repeat(user_inputs)
+        ))
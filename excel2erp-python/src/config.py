@@ -76,11 +76,28 @@ Production systems might add schema validation (e.g., jsonschema, pydantic).
 For this educational project, errors surface as clear Python exceptions.
 """
 
+import os
+
 import yaml
+
+# Prefer the libyaml-backed C loader; fall back to pure Python when PyYAML
+# was built without libyaml. Both accept the same safe subset of YAML.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from model import (
     Config, Source, SourceProperty, DetailConfig,
     ResultConfig, FileSpec, ResultProperty
 )
+from excel import parse_cell_address
+
+
+# Parsed configurations keyed by absolute path. Each entry remembers the
+# (mtime, size) it was parsed from, so an edited file is re-read on the next
+# call while an unchanged one is returned as the same frozen Config.
+_cache: dict[str, tuple[tuple[int, int], Config]] = {}
 
 
 def load_config(path: str) -> Config:
@@ -102,24 +119,48 @@ def load_config(path: str) -> Config:
         FileNotFoundError: If the configuration file doesn't exist.
         yaml.YAMLError: If the file contains invalid YAML syntax.
         KeyError: If required fields are missing from the configuration.
+        ValueError: If a header or detail locator is not a valid cell address.
 
     Example:
         config = load_config("shared/excel2erp.yaml")
         print(config.description)  # "Pedidos El Dorado"
+
+    Note:
+        Results are memoized per file. Repeated calls for an unchanged file
+        return the same Config instance, which is safe because the model
+        dataclasses are frozen.
     """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _cache.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+
+    config = _parse_config(key)
+    _cache[key] = (stamp, config)
+    return config
+
+
+def _parse_config(path: str) -> Config:
+    """Read the YAML file at path and build the Config hierarchy."""
     # Read and parse the YAML file
     # Using UTF-8 encoding explicitly for cross-platform compatibility
     with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     # Parse the sources section
     # Each source defines how to extract data from a specific Excel format
     sources = []
     for src in data.get("sources", []):
         # Parse header properties (single-cell extractions)
-        # Each property maps a cell address to a named field
+        # Each property maps a cell address to a named field; the address
+        # is resolved to (row, col) here, once, rather than per extraction
         header_props = [
-            SourceProperty(p["name"], p["locator"], p.get("replacements", {}))
+            SourceProperty(
+                p["name"], p["locator"], p.get("replacements", {}),
+                coordinates=parse_cell_address(p["locator"])
+            )
             for p in src.get("header", [])
         ]
 
@@ -140,7 +181,8 @@ def load_config(path: str) -> Config:
             detail=DetailConfig(
                 locator=src["detail"]["locator"],  # Table start address
                 properties=detail_props,
-                end_value=src["detail"].get("endValue")  # Optional sentinel
+                end_value=src["detail"].get("endValue"),  # Optional sentinel
+                coordinates=parse_cell_address(src["detail"]["locator"])
             ),
             default_values=src.get("defaultValues", {})  # Injected values
         ))
@@ -37,10 +37,12 @@ EXTRACTION FLOW:
 ----------------
 1. extract_header() - Reads single cells for order metadata
 2. extract_detail() - Reads table rows for line items
+   (iter_detail() yields the same rows lazily)
 3. missing_properties() - Identifies fields needing user input
 4. [User provides missing values]
 5. generate_content() - Formats data into delimited text
 6. create_zip() - Bundles header + detail files into ZIP
+   (write_zip() is the streaming equivalent of 5 and 6 combined)
 
 VALUE RESOLUTION HIERARCHY:
 ---------------------------
@@ -57,12 +59,32 @@ overridden at multiple levels.
 
 import re
 import io
+import os
 import zipfile
-from typing import Any
+from typing import Any, BinaryIO, Iterable, Iterator
 from openpyxl.worksheet.worksheet import Worksheet
 
 from model import Source, FileSpec, ResultConfig, ResultProperty, SourceProperty
-from excel import parse_cell_address, cell_to_string, read_table
+from excel import parse_cell_address, read_cells, read_table_rows, value_to_string
+
+
+# Everything that is not a digit, stripped by normalize_date()
+_NON_DIGIT_RE = re.compile(r"\D+")
+
+# The separators date pickers and users actually type; deleting them with
+# str.translate avoids the regex engine for the common cases
+_DATE_SEPARATORS = str.maketrans("", "", "-/. ")
+
+# default_format of a property whose default is exactly "${index}"
+_INDEX_FORMAT = "{index}"
+
+# DEFLATE level for generated files. Level 1 keeps nearly all of the
+# default level's ratio on delimited text at several times the speed.
+ZIP_COMPRESSLEVEL = 1
+
+# Entries smaller than this (in bytes) are stored uncompressed; deflating
+# a one-line header saves almost nothing and still costs a compressor setup.
+ZIP_STORE_BELOW = 4096
 
 
 def apply_replacements(value: str, prop: SourceProperty) -> str:
@@ -81,6 +103,13 @@ def apply_replacements(value: str, prop: SourceProperty) -> str:
         The value after all replacements have been applied.
         If no replacements are defined, returns the original value.
 
+    Performance:
+        Patterns are compiled once when the SourceProperty is built
+        (see SourceProperty.compiled_replacements), not per value.
+        Plain-string keys that cannot interact are folded into a single
+        alternation (SourceProperty.literal_pattern), so the value is
+        scanned once instead of once per replacement.
+
     Replacement Order:
         Replacements are applied in dictionary iteration order.
         In Python 3.7+, this is insertion order, so the order in the
@@ -93,11 +122,15 @@ def apply_replacements(value: str, prop: SourceProperty) -> str:
         Step 1: "^0+" matches "00", replaced with "" → "123-456"
         Step 2: "-" matches "-", replaced with "" → "123456"
     """
+    # All-literal keys: one scan, dictionary lookup per match
+    if prop.literal_pattern is not None:
+        literal_map = prop.literal_map
+        return prop.literal_pattern.sub(lambda m: literal_map[m.group()], value)
+
     result = value
-    for pattern, replacement in prop.replacements.items():
-        # re.sub handles the full regex syntax
-        # Convert pattern and replacement to strings to handle YAML edge cases
-        result = re.sub(str(pattern), str(replacement), result)
+    for pattern, replacement in prop.compiled_replacements:
+        # Compiled patterns support the full regex syntax
+        result = pattern.sub(replacement, result)
     return result
 
 
@@ -109,7 +142,7 @@ def extract_header(sheet: Worksheet, source: Source, result_header: FileSpec) ->
     order date, etc. Each field is extracted from a configured cell address.
 
     Args:
-        sheet: The openpyxl Worksheet to extract from.
+        sheet: The openpyxl Worksheet to extract from (regular or read-only).
         source: The Source configuration defining which cells to read.
         result_header: The FileSpec with default values for missing fields.
 
@@ -134,16 +167,18 @@ def extract_header(sheet: Worksheet, source: Source, result_header: FileSpec) ->
     # Overlay source-level defaults
     data.update(source.default_values)
 
-    # Extract each configured header property
-    for prop in source.header:
-        # Parse the cell address (e.g., "B3" → row 3, col 2)
-        row, col = parse_cell_address(prop.locator)
-
-        # Read the cell value and convert to string
-        value = cell_to_string(sheet.cell(row, col))
+    # Cell addresses (e.g., "B3" → row 3, col 2) are normally resolved at
+    # config load; read all header cells in a single sweep over the sheet
+    coordinates = [
+        prop.coordinates or parse_cell_address(prop.locator)
+        for prop in source.header
+    ]
+    values = read_cells(sheet, coordinates)
 
-        # Apply any configured text replacements (regex-based)
-        data[prop.name] = apply_replacements(value, prop)
+    # Apply any configured text replacements (regex-based); most properties
+    # have none, so skip the call for those
+    for prop, value in zip(source.header, values):
+        data[prop.name] = apply_replacements(value, prop) if prop.compiled_replacements else value
 
     return data
 
@@ -173,22 +208,45 @@ def extract_detail(sheet: Worksheet, source: Source) -> list[dict[str, str]]:
         Only columns listed in properties are included in the output.
         Other columns in the Excel table are ignored.
     """
-    # Read the raw table using column headers as keys
-    raw_rows = read_table(sheet, source.detail.locator, source.detail.end_value)
+    return list(iter_detail(sheet, source))
+
+
+def iter_detail(sheet: Worksheet, source: Source) -> Iterator[dict[str, str]]:
+    """
+    Yield detail rows one at a time; the lazy form of extract_detail().
+
+    The table is scanned when iteration starts, so the sheet must stay open
+    until the rows have been consumed (e.g. by write_zip()).
+    """
+    detail = source.detail
 
-    # Build a lookup: Excel column header → SourceProperty
+    # Lookup built at config load: Excel column header → SourceProperty
     # This lets us map column headers to normalized field names
-    col_map = {p.locator: p for p in source.detail.properties}
+    col_map = detail.column_map
+
+    # Scan the table once; rows come back as raw value tuples
+    headers, rows = read_table_rows(
+        sheet, detail.coordinates or detail.locator, detail.end_value
+    )
+
+    # Resolve mapped columns to (tuple position, field name, property) once.
+    # The property is kept only when it has replacements, so plain columns
+    # skip the apply_replacements() call. Unmapped columns are never converted.
+    mapped = [
+        (i, prop.name, prop if prop.compiled_replacements else None)
+        for i, h in enumerate(headers)
+        if (prop := col_map.get(h)) is not None
+    ]
 
-    # Transform each row: rename columns and apply replacements
-    return [
-        {
-            col_map[k].name: apply_replacements(v, col_map[k])
-            for k, v in row.items()
-            if k in col_map  # Only include mapped columns
+    # Build each output row straight from its tuple: rename columns and
+    # apply replacements, with no intermediate header-keyed dict per row.
+    # Keys keep the table's column order, which the GUI preview relies on.
+    for values in rows:
+        yield {
+            name: value_to_string(values[i]) if prop is None
+            else apply_replacements(value_to_string(values[i]), prop)
+            for i, name, prop in mapped
         }
-        for row in raw_rows
-    ]
 
 
 def missing_properties(source: Source, result_header: FileSpec) -> list[ResultProperty]:
@@ -217,20 +275,30 @@ def missing_properties(source: Source, result_header: FileSpec) -> list[ResultPr
         from Excel, but the output requires invoiceDate as well:
         - invoiceDate would be returned as a missing property
         - UI would show a date picker for the user to input it
+
+        The answer depends only on the (frozen) configuration, so front ends
+        compute it once per source when they start, not per workbook.
     """
     # Fields that will be extracted from Excel
     extracted = {p.name for p in source.header}
 
     # Fields with default values (from source or result)
-    defaulted = set(source.default_values.keys()) | set(result_header.default_values.keys())
+    defaulted = source.default_values.keys() | result_header.default_values.keys()
 
-    # Return properties that are neither extracted nor defaulted
+    # Keep properties that are neither extracted nor defaulted
     return [
         p for p in result_header.properties
         if p.name not in extracted and p.name not in defaulted
     ]
 
 
+class _TemplateContext(dict):
+    """Lookup table for str.format_map(); unknown names expand to "" like expand()."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
 def expand(template: str, props: dict[str, Any]) -> str:
     """
     Expand ${placeholder} syntax in a template string.
@@ -254,9 +322,39 @@ def expand(template: str, props: dict[str, Any]) -> str:
         expand("${unknown}", {})
         → ""
     """
-    # \$\{(\w+)\} matches ${word_characters}
-    # The lambda looks up the captured group in props
-    return re.sub(r"\$\{(\w+)\}", lambda m: str(props.get(m.group(1), "")), template)
+    # Hand-rolled scan for ${word_characters}, the same grammar as the
+    # regex r"\$\{(\w+)\}" but without regex dispatch: templates are short
+    # and expanded per record
+    start = template.find("${")
+    if start < 0:
+        return template
+
+    parts = []
+    pos = 0
+    while start >= 0:
+        end = template.find("}", start + 2)
+        if end < 0:
+            break
+        name = template[start + 2:end]
+        if _is_word(name):
+            parts.append(template[pos:start])
+            value = props.get(name, "")
+            parts.append(value if type(value) is str else str(value))
+            pos = end + 1
+            start = template.find("${", pos)
+        else:
+            # Not a placeholder; a later "${" inside name may still be one
+            start = template.find("${", start + 2)
+    parts.append(template[pos:])
+    return "".join(parts)
+
+
+def _is_word(name: str) -> bool:
+    """True if name matches \\w+, i.e. is non-empty and alphanumeric or "_"."""
+    if name.isalnum():
+        return True
+    stripped = name.replace("_", "")
+    return bool(name) and (not stripped or stripped.isalnum())
 
 
 def normalize_date(value: str) -> str:
@@ -279,7 +377,11 @@ def normalize_date(value: str) -> str:
         strips non-digits. The tkcalendar DateEntry widget is configured
         to output YYYY-MM-DD format, which becomes YYYYMMDD after normalization.
     """
-    return re.sub(r"\D+", "", value)
+    digits = value.translate(_DATE_SEPARATORS)
+    if not digits or digits.isdecimal():
+        return digits
+    # Some other non-digit (e.g. a "T" or a time suffix) is present
+    return _NON_DIGIT_RE.sub("", digits)
 
 
 def generate_content(spec: FileSpec, separator: str, records: list[dict[str, Any]]) -> str:
@@ -315,6 +417,8 @@ def generate_content(spec: FileSpec, separator: str, records: list[dict[str, Any
 
         If the value contains ${} placeholders, they're expanded using
         the record's data plus an "index" variable (0-based row number).
+        Default values use the template prebuilt in
+        ResultProperty.default_format, so no regex runs per record.
 
     Example Output:
         HDR
@@ -323,34 +427,78 @@ def generate_content(spec: FileSpec, separator: str, records: list[dict[str, Any
 
         Where HDR is prolog, the middle line is data, and EOF is epilog.
     """
-    lines = []
+    # One C-level join over the streamed lines; no intermediate StringIO
+    return "".join(iter_content(spec, separator, records))
+
+
+def iter_content(spec: FileSpec, separator: str,
+                 records: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """
+    Yield delimited text content one line at a time.
+
+    The pieces concatenate to exactly what generate_content() returns. Each
+    piece after the first starts with its "\\n" line break, so consumers
+    can write them as they arrive without tracking the last line.
+    Used by generate_content() and write_zip().
+    """
+    # Newline goes *before* every line but the first: no trailing newline
+    line_break = ""
 
     # Add prolog if defined (e.g., file header marker)
     if spec.prolog:
-        lines.append(spec.prolog.rstrip())
+        yield spec.prolog.rstrip()
+        line_break = "\n"
+
+    # Resolve per-column attributes once, outside the per-cell loop.
+    # A bare ${index} default (row numbering) is flagged so it can be
+    # emitted directly, without building the record's template context.
+    columns = [
+        (prop.name, prop.default_format, prop.default_value or "",
+         prop.default_format == _INDEX_FORMAT)
+        for prop in spec.properties
+    ]
 
     # Generate one line per record
     for idx, record in enumerate(records):
+        get = record.get
+        context = None  # built lazily, at most once per record
         values = []
-        for prop in spec.properties:
+        append = values.append
+        for name, default_format, default_value, index_only in columns:
             # Resolve value with fallback chain
-            value = record.get(prop.name) or prop.default_value or ""
-
-            # Expand any ${placeholder} syntax in the value
-            # Include "index" for auto-numbering (useful in detail lines)
-            if "${" in str(value):
-                value = expand(str(value), {**record, "index": idx})
-
-            values.append(str(value))
+            value = get(name)
+            if not value:
+                if index_only:
+                    append(str(idx))
+                    continue
+                if default_format is not None:
+                    # Prebuilt template: one format_map() call instead of a regex pass
+                    # Include "index" for auto-numbering (useful in detail lines)
+                    if context is None:
+                        context = _TemplateContext(record, index=idx)
+                    append(default_format.format_map(context))
+                    continue
+                value = default_value
+
+            if type(value) is not str:
+                value = str(value)
+
+            # Expand any ${placeholder} syntax in the value, sharing the
+            # record's context with the default templates above
+            if "${" in value:
+                if context is None:
+                    context = _TemplateContext(record, index=idx)
+                value = expand(value, context)
+
+            append(value)
 
         # Join values with separator to form the line
-        lines.append(separator.join(values))
+        yield line_break + separator.join(values)
+        line_break = "\n"
 
     # Add epilog if defined (e.g., file footer marker)
     if spec.epilog:
-        lines.append(spec.epilog.rstrip())
-
-    return "\n".join(lines)
+        yield line_break + spec.epilog.rstrip()
 
 
 def create_zip(header_content: str, detail_content: str, result: ResultConfig) -> bytes:
@@ -374,7 +522,9 @@ def create_zip(header_content: str, detail_content: str, result: ResultConfig) -
         - result.header.filename (e.g., "HEADER.txt")
         - result.detail.filename (e.g., "DETAIL.txt")
 
-        Both files are UTF-8 encoded and compressed with DEFLATE.
+        Both files are UTF-8 encoded. Files of ZIP_STORE_BELOW bytes or
+        more are compressed with DEFLATE at ZIP_COMPRESSLEVEL; smaller ones
+        (typically the header) are stored as-is.
 
     Implementation:
         Uses io.BytesIO as an in-memory file buffer, avoiding disk I/O.
@@ -384,12 +534,81 @@ def create_zip(header_content: str, detail_content: str, result: ResultConfig) -
     buffer = io.BytesIO()
 
     # Write both files to the ZIP archive
-    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        # Add header file (encode string to bytes)
-        zf.writestr(result.header.filename, header_content.encode("utf-8"))
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=ZIP_COMPRESSLEVEL) as zf:
+        # Add header file
+        _write_text_entry(zf, result.header.filename, header_content)
 
         # Add detail file
-        zf.writestr(result.detail.filename, detail_content.encode("utf-8"))
+        _write_text_entry(zf, result.detail.filename, detail_content)
 
     # Return the complete ZIP as bytes
     return buffer.getvalue()
+
+
+def write_zip(target: str | os.PathLike | BinaryIO, result: ResultConfig,
+              header_records: Iterable[dict[str, Any]],
+              detail_records: Iterable[dict[str, Any]]) -> None:
+    """
+    Stream header and detail files straight into a ZIP archive.
+
+    Equivalent to create_zip(generate_content(...), generate_content(...)),
+    but each line is encoded and compressed as it is produced. Peak memory no
+    longer holds the list of lines, the joined string and its UTF-8 bytes all
+    at once, which matters for large detail tables.
+
+    Args:
+        target: A file path or a seekable, writable binary file object
+                (e.g. BytesIO).
+        result: The ResultConfig with separator and file specifications.
+        header_records: Header data (normally a single-element list).
+        detail_records: Detail data; may be a generator.
+
+    The archive matches create_zip(): same entry names, UTF-8 text, and the
+    same compression choice per entry (stored below ZIP_STORE_BELOW bytes,
+    DEFLATE at ZIP_COMPRESSLEVEL otherwise). header_records is rendered in
+    full before writing, since it is one line in practice; the detail is
+    read ahead up to ZIP_STORE_BELOW characters to make that choice.
+    """
+    with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED,
+                         compresslevel=ZIP_COMPRESSLEVEL) as zf:
+        # The header is a single line: build it whole so small ones can be stored
+        _write_text_entry(zf, result.header.filename, generate_content(
+            result.header, result.separator, header_records
+        ))
+        _write_text_stream(zf, result.detail.filename,
+                           iter_content(result.detail, result.separator, detail_records))
+
+
+def _write_text_entry(zf: zipfile.ZipFile, filename: str, content: str) -> None:
+    """Add a complete text file, stored uncompressed if below ZIP_STORE_BELOW bytes."""
+    data = content.encode("utf-8")
+    compress_type = zipfile.ZIP_STORED if len(data) < ZIP_STORE_BELOW else zipfile.ZIP_DEFLATED
+    zf.writestr(filename, data, compress_type=compress_type)
+
+
+def _write_text_stream(zf: zipfile.ZipFile, filename: str, pieces: Iterator[str]) -> None:
+    """Add a text file from streamed pieces, compressed as _write_text_entry() would."""
+    # Read ahead up to the store threshold. A file that ends before it is
+    # small enough to build whole (and maybe store); UTF-8 never has fewer
+    # bytes than characters, so a longer one is always deflated.
+    head = []
+    size = 0
+    for piece in pieces:
+        head.append(piece)
+        size += len(piece)
+        if size >= ZIP_STORE_BELOW:
+            break
+    else:
+        _write_text_entry(zf, filename, "".join(head))
+        return
+
+    # Opened by name, the entry takes the archive's compression and level
+    # (and zipfile's default 1980-01-01 timestamp, as no ZipInfo is given)
+    with zf.open(filename, "w") as raw:
+        out = io.TextIOWrapper(raw, encoding="utf-8", newline="\n")
+        out.write("".join(head))
+        out.writelines(pieces)
+        out.flush()
+        # Detach so the wrapper doesn't close the entry twice
+        out.detach()
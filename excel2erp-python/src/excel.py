@@ -42,13 +42,34 @@ Special handling:
 - Dates → YYYYMMDD format (no separators)
 - Floats that are whole numbers → integers (removes ".0")
 - None/empty → empty string
+
+OPENING WORKBOOKS:
+------------------
+open_sheet() opens one worksheet for extraction. It uses python-calamine
+(an optional, Rust-based reader) when installed, and otherwise openpyxl in
+read-only mode. Both expose the iter_rows(values_only=True) interface that
+read_cells() and read_table() rely on.
 """
 
-import re
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, date
+from functools import lru_cache
+from typing import Any
+
+from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
+try:  # Optional Rust-based reader, much faster than openpyxl on large sheets
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
 
+
+# Addresses come from a small, fixed configuration, so results are memoized.
+# Callers on hot paths use the (row, col) resolved at config load instead.
+@lru_cache(maxsize=1024)
 def parse_cell_address(address: str) -> tuple[int, int]:
     """
     Parse an A1-style cell address into (row, column) indices.
@@ -78,38 +99,47 @@ def parse_cell_address(address: str) -> tuple[int, int]:
         The formula is: col = Σ(letter_value × 26^position)
         For "AA": A(26^1) + A(26^0) = 26 + 1 = 27
     """
-    # Match pattern: one or more letters followed by one or more digits
-    match = re.match(r"([A-Za-z]+)(\d+)", address)
-    if not match:
-        raise ValueError(f"Invalid cell address: {address}")
+    # Scan by hand instead of running a regex: one or more ASCII letters
+    # followed by one or more digits. As with re.match, anything after the
+    # digits is ignored.
+    n = len(address)
+    i = 0
+    col = 0
+    while i < n:
+        c = address[i]
+        if "A" <= c <= "Z":
+            # Shift existing value by one "digit" (×26) and add new letter value
+            col = col * 26 + (ord(c) - 64)
+        elif "a" <= c <= "z":
+            col = col * 26 + (ord(c) - 96)
+        else:
+            break
+        i += 1
 
-    col_str, row_str = match.groups()
+    j = i
+    while j < n and address[j].isdecimal():
+        j += 1
 
-    # Convert column letters to number using base-26 arithmetic
-    # Each letter position represents a power of 26
-    col = 0
-    for c in col_str.upper():
-        # Shift existing value by one "digit" (×26) and add new letter value
-        col = col * 26 + (ord(c) - ord("A") + 1)
+    if i == 0 or j == i:
+        raise ValueError(f"Invalid cell address: {address}")
 
-    return int(row_str), col
+    return int(address[i:j]), col
 
 
-def cell_to_string(cell) -> str:
+def value_to_string(value) -> str:
     """
-    Convert a cell's value to a string representation.
+    Convert a raw cell value to a string representation.
 
     This function normalizes Excel cell values to strings for consistent
     processing. Different value types are handled appropriately to produce
     output suitable for the ERP import format.
 
     Args:
-        cell: An openpyxl Cell object (not just the value).
-              We take the cell rather than cell.value to allow for
-              potential future use of cell formatting information.
+        value: A raw cell value, as produced by openpyxl's
+               iter_rows(values_only=True) or Cell.value.
 
     Returns:
-        A string representation of the cell's value:
+        A string representation of the value:
         - None → "" (empty string)
         - datetime/date → "YYYYMMDD" (no separators, ERP-friendly)
         - float that equals an integer → "123" (not "123.0")
@@ -125,29 +155,118 @@ def cell_to_string(cell) -> str:
         To avoid "5.0" in output, we convert whole-number floats to integers
         before stringifying.
     """
-    # Handle empty cells
-    if cell.value is None:
+    # Fast path: exact type checks for the common cell types, most frequent
+    # first. type() identity skips the MRO walk isinstance() does, and this
+    # runs once per cell read.
+    kind = type(value)
+    if kind is str:
+        return value
+    if value is None:
+        # Handle empty cells
         return ""
-
+    if kind is float:
+        # Excel often stores "5" as 5.0, which would stringify as "5.0".
+        # is_integer() is False for nan/inf, which int() would reject.
+        return str(int(value)) if value.is_integer() else str(value)
+    if kind is int:
+        return str(value)
+    if kind is datetime or kind is date:
+        # Same as strftime("%Y%m%d") for Excel's year range (1900+), without
+        # parsing the format string on every cell
+        return f"{value.year:04d}{value.month:02d}{value.day:02d}"
+
+    # Slow path: subclasses and anything else
     # Handle datetime objects (Excel stores dates as datetime)
     # Convert to YYYYMMDD format for ERP compatibility
-    if isinstance(cell.value, datetime):
-        return cell.value.strftime("%Y%m%d")
+    if isinstance(value, datetime):
+        return value.strftime("%Y%m%d")
 
     # Handle date objects (less common, but possible)
-    if isinstance(cell.value, date):
-        return cell.value.strftime("%Y%m%d")
+    if isinstance(value, date):
+        return value.strftime("%Y%m%d")
 
     # Handle floats that are actually integers
     # Excel often stores "5" as 5.0, which would stringify as "5.0"
-    if isinstance(cell.value, float) and cell.value == int(cell.value):
-        return str(int(cell.value))
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
 
     # Default: convert to string
-    return str(cell.value)
+    return str(value)
+
+
+def cell_to_string(cell) -> str:
+    """
+    Convert a cell's value to a string representation.
+
+    Thin wrapper over value_to_string() for callers holding Cell objects
+    rather than raw values.
+
+    Args:
+        cell: An openpyxl Cell (or anything with a `value` attribute).
 
+    Returns:
+        The string representation described in value_to_string().
+    """
+    return value_to_string(cell.value)
 
-def read_table(sheet: Worksheet, start_address: str, end_value: str | None = None) -> list[dict[str, str]]:
+
+def read_cells(sheet: Worksheet, coordinates: list[tuple[int, int]]) -> list[str]:
+    """
+    Read scattered single cells from a worksheet in one sweep.
+
+    Header extraction needs a handful of cells spread over the top of the
+    sheet. Random access via sheet.cell() is cheap on a regular worksheet
+    but re-parses the sheet XML on every call for a read-only worksheet.
+    Instead, this function computes the bounding box of all requested
+    cells, streams it once with iter_rows(values_only=True), keeps only the
+    rows that contain a requested cell, and picks the values out of those.
+
+    Args:
+        sheet: An openpyxl Worksheet (regular or read-only).
+        coordinates: 1-based (row, column) tuples, as returned by
+                     parse_cell_address().
+
+    Returns:
+        One string per coordinate, in the same order, converted with
+        value_to_string(). Cells outside the sheet's data read as "".
+    """
+    if not coordinates:
+        return []
+
+    # Bounding box of all requested cells
+    min_row = min(row for row, _ in coordinates)
+    max_row = max(row for row, _ in coordinates)
+    min_col = min(col for _, col in coordinates)
+    max_col = max(col for _, col in coordinates)
+
+    # One streaming pass over the box, keeping only the rows that hold a
+    # requested cell (header cells are often far apart, e.g. rows 2 and 40).
+    # Read-only sheets may return fewer rows than requested when the sheet
+    # ends early, hence the guards below.
+    wanted_rows = {row for row, _ in coordinates}
+    kept = {
+        row: values
+        for row, values in enumerate(sheet.iter_rows(
+            min_row=min_row, max_row=max_row,
+            min_col=min_col, max_col=max_col,
+            values_only=True
+        ), start=min_row)
+        if row in wanted_rows
+    }
+
+    values = []
+    for row, col in coordinates:
+        cells, c = kept.get(row, ()), col - min_col
+        value = cells[c] if c < len(cells) else None
+        values.append(value_to_string(value))
+    return values
+
+
+def read_table(
+    sheet: Worksheet,
+    start_address: str | tuple[int, int],
+    end_value: str | None = None
+) -> list[dict[str, str]]:
     """
     Read a tabular region from an Excel worksheet.
 
@@ -160,10 +279,14 @@ def read_table(sheet: Worksheet, start_address: str, end_value: str | None = Non
     and values are the cell contents as strings.
 
     Args:
-        sheet: An openpyxl Worksheet object to read from.
+        sheet: An openpyxl Worksheet object to read from. Read-only
+               worksheets (load_workbook(..., read_only=True)) work too;
+               the table is streamed in a single pass either way.
 
         start_address: A1-style address of the top-left cell of the header row.
                        Example: "A10" means headers start at row 10, column A.
+                       An already resolved 1-based (row, column) tuple is
+                       accepted as well, e.g. DetailConfig.coordinates.
 
         end_value: Optional sentinel value that marks end of data.
                    If the first column of a row equals this value, reading stops.
@@ -191,48 +314,157 @@ def read_table(sheet: Worksheet, start_address: str, end_value: str | None = Non
         - If all columns are empty in header row, returns empty list
         - Headers with trailing spaces are preserved (not trimmed)
     """
+    headers, rows = read_table_rows(sheet, start_address, end_value)
+
+    # Build a dictionary for each row: header_name → cell_value
+    # (a repeated header keeps the last column's value)
+    return [
+        {header: value_to_string(value) for header, value in zip(headers, values)}
+        for values in rows
+    ]
+
+
+def read_table_rows(
+    sheet: Worksheet,
+    start_address: str | tuple[int, int],
+    end_value: str | None = None
+) -> tuple[list[str], list[tuple]]:
+    """
+    Read a table's header names and its data rows as raw value tuples.
+
+    This is the scanning half of read_table(), with the same table detection
+    rules, but it leaves the rows as openpyxl produced them: one tuple of raw
+    values per row, aligned with the headers. Callers that map columns to
+    their own keys (see engine.extract_detail()) can then build their output
+    straight from the tuples, without an intermediate dict per row.
+
+    Args:
+        sheet: An openpyxl Worksheet (regular or read-only).
+        start_address: A1-style address, or 1-based (row, column) tuple,
+                       of the top-left header cell.
+        end_value: Optional sentinel in the first column that ends the table.
+
+    Returns:
+        (headers, rows): the header names, and a list of value tuples with
+        len(headers) entries each. Cell values are NOT converted; use
+        value_to_string() on the ones you need. ([], []) if there is no header.
+    """
     # Parse the starting cell address to get row and column indices
-    start_row, start_col = parse_cell_address(start_address)
+    if isinstance(start_address, tuple):
+        start_row, start_col = start_address
+    else:
+        start_row, start_col = parse_cell_address(start_address)
 
     # PHASE 1: Read header row
-    # Scan rightward from the start column, collecting header names
-    # Stop when we hit an empty cell (marks end of table columns)
+    # Fetch the header row once, scanning rightward from the start column
+    # and collecting header names until we hit an empty cell (end of columns)
+    header_row = next(sheet.iter_rows(
+        min_row=start_row, max_row=start_row,
+        min_col=start_col, values_only=True
+    ), ())
     headers = []
-    col = start_col
-    while True:
-        val = cell_to_string(sheet.cell(start_row, col))
-        if not val.strip():
+    for value in header_row:
+        val = value_to_string(value)
+        if not val or val.isspace():
             # Empty header cell marks the end of columns
             break
         headers.append(val)
-        col += 1
 
     # If no headers found, the table is empty or start_address is wrong
     if not headers:
-        return []
+        return [], []
 
     # PHASE 2: Read data rows
-    # Scan downward from the row after headers
+    # Stream the rows below the header, restricted to the table's columns.
+    # A single iter_rows pass avoids per-cell sheet.cell() lookups, which
+    # matters most for read-only worksheets.
     # Stop when first cell is empty or matches end_value sentinel
     rows = []
-    row_num = start_row + 1  # Data starts one row after headers
-
-    while True:
+    for values in sheet.iter_rows(
+        min_row=start_row + 1,  # Data starts one row after headers
+        min_col=start_col,
+        max_col=start_col + len(headers) - 1,
+        values_only=True
+    ):
         # Check the first cell to determine if we should continue
-        first_cell = cell_to_string(sheet.cell(row_num, start_col))
+        first_cell = value_to_string(values[0]) if values else ""
 
         # Stop conditions:
         # 1. First cell is empty (or whitespace only)
         # 2. First cell matches the end sentinel value
-        if not first_cell.strip() or (end_value and first_cell == end_value):
+        # (isspace() tests blank cells without building a stripped copy)
+        if not first_cell or first_cell.isspace() or (end_value and first_cell == end_value):
             break
 
-        # Build a dictionary for this row: header_name → cell_value
-        row_data = {
-            headers[i]: cell_to_string(sheet.cell(row_num, start_col + i))
-            for i in range(len(headers))
-        }
-        rows.append(row_data)
-        row_num += 1
+        rows.append(values)
+
+    return headers, rows
+
 
-    return rows
+class CalamineSheet:
+    """
+    Worksheet facade over rows materialized by python-calamine.
+
+    Implements the iter_rows(values_only=True) subset used by read_cells()
+    and read_table(), so extraction code works unchanged on either reader.
+
+    Attributes:
+        rows: All sheet rows from cell A1 on, as lists of raw values.
+              Calamine reports empty cells as "", which value_to_string()
+              already treats like None.
+    """
+
+    def __init__(self, rows: list[list[Any]]):
+        self.rows = rows
+
+    def iter_rows(self, min_row=1, max_row=None, min_col=1, max_col=None, values_only=True):
+        """Yield value tuples like openpyxl, padded with None up to max_col."""
+        for row in self.rows[min_row - 1:max_row]:
+            values = tuple(row[min_col - 1:max_col])
+            if max_col is not None:
+                values += (None,) * (max_col - min_col + 1 - len(values))
+            yield values
+
+
+@contextmanager
+def open_sheet(file, sheet_index: int) -> Iterator[Worksheet | CalamineSheet]:
+    """
+    Open one worksheet of an .xlsx file for extraction.
+
+    Args:
+        file: A path or a binary file object (e.g., an uploaded file).
+        sheet_index: Zero-based index of the worksheet (Source.sheet_index).
+
+    Yields:
+        A sheet supporting iter_rows(values_only=True): a CalamineSheet when
+        python-calamine is installed, else a read-only openpyxl Worksheet.
+        The workbook is closed when the with-block exits.
+
+    Example:
+        with open_sheet("order.xlsx", source.sheet_index) as sheet:
+            header = extract_header(sheet, source, config.result.header)
+    """
+    if CalamineWorkbook is not None:
+        if isinstance(file, (str, os.PathLike)):
+            wb = CalamineWorkbook.from_path(os.fspath(file))
+        else:
+            wb = CalamineWorkbook.from_filelike(file)
+        try:
+            rows = wb.get_sheet_by_index(sheet_index).to_python(skip_empty_area=False)
+        finally:
+            wb.close()
+        yield CalamineSheet(rows)
+        return
+
+    # Read-only: values are streamed, not held as a DOM
+    wb = load_workbook(file, data_only=True, read_only=True, keep_links=False)
+    try:
+        sheet = wb.worksheets[sheet_index]
+        # Read-only sheets trust the file's <dimension> tag to bound
+        # iter_rows(). Some writers leave it at "A1:A1" (or omit it), which
+        # would hide every other cell; drop it and read to the real end.
+        if (sheet.max_row or 1) <= 1 and (sheet.max_column or 1) <= 1:
+            sheet.reset_dimensions()
+        yield sheet
+    finally:
+        wb.close()
@@ -99,26 +99,50 @@ This pattern:
 - Resets cleanly after export (morphs back to file picker mode)
 
 State transitions:
-    [Start] → _on_source_selected() → data_loaded = False, button = "Archivo pedido"
+    [Start] → _apply_source_selection() → data_loaded = False, button = "Archivo pedido"
     [Pick]  → _load_and_preview()   → data_loaded = True,  button = "Generar Archivo ERP"
     [Save]  → _reset_to_file_picker() → data_loaded = False, button = "Archivo pedido"
     [Error] → _reset_to_file_picker() → data_loaded = False, button = "Archivo pedido"
 """
 
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from collections import OrderedDict
+from tkinter import ttk
 from pathlib import Path
+from typing import Callable
 
-from openpyxl import load_workbook
-from tkcalendar import DateEntry
+# tkinter.filedialog, tkinter.messagebox and tkcalendar are imported where
+# they are first used, so `--help` and module import (e.g. test collection)
+# don't pay for them; tkcalendar in particular pulls in babel.
 
 from config import load_config
+from excel import open_sheet
 from model import Config, Source, ResultProperty
 from engine import (
     extract_header, extract_detail, missing_properties,
-    generate_content, create_zip, expand, normalize_date
+    write_zip, expand, normalize_date
 )
 
+# Recently loaded files kept in memory, so picking the same unchanged
+# file again (for the same source) skips parsing
+LOAD_CACHE_SIZE = 4
+
+# Quiet period after a source selection before the form is rebuilt
+SOURCE_SELECT_DELAY_MS = 150
+
+# Detail rows shown when a file is loaded; the rest are inserted only if
+# the user asks for them, so the preview appears quickly for any file size.
+# The export always uses all rows.
+PREVIEW_LIMIT = 200
+
+# Detail rows inserted into the preview per event-loop turn. Kept well
+# below PREVIEW_LIMIT so even the initial preview yields to the event loop
+# between batches, and "show all" fills in progressively instead of
+# blocking the window until every row has been inserted.
+PREVIEW_BATCH_SIZE = 50
+
 
 class Excel2ErpApp:
     """
@@ -152,6 +176,7 @@ class Excel2ErpApp:
         header_tree: Treeview displaying header key-value pairs.
         detail_tree: Treeview displaying detail table rows.
         detail_label: Label showing detail row count.
+        show_all_btn: Button revealing detail rows beyond PREVIEW_LIMIT.
         status_var: StringVar for status message display.
     """
 
@@ -168,12 +193,26 @@ class Excel2ErpApp:
         self.config = config
         self.basedir = basedir
 
+        # Dropdown entries are source descriptions; map them back in O(1)
+        self._source_by_description = {s.description: s for s in config.sources}
+
+        # Fields to prompt for depend only on the config: compute them once
+        self._missing_by_source = {
+            s.name: missing_properties(s, config.result.header) for s in config.sources
+        }
+
         # Initialize state variables
         self.selected_source: Source | None = None
         self.selected_file: Path | None = None
         self.missing_props: list[ResultProperty] = []
         self.field_widgets: dict[str, tk.Widget] = {}
+        self._value_getters: list[tuple[str, Callable[[], str]]] = []  # (name, read widget)
         self.data_loaded = False  # Controls button behavior (see module docstring)
+        self._source_logos: dict[str, tk.PhotoImage | None] = {}  # See _source_logo()
+        self._detail_columns: tuple[str, ...] = ()  # Columns configured on detail_tree
+        self._preview_token: object | None = None  # Current _insert_detail_rows chain
+        self._source_after_id: str | None = None  # Pending _apply_source_selection
+        self._load_cache: OrderedDict[tuple, tuple[dict, list]] = OrderedDict()  # LRU, see _load_key()
 
         # Extracted data storage (populated after file load)
         self.header_data: dict[str, str] = {}
@@ -188,6 +227,12 @@ class Excel2ErpApp:
         self._load_logo()
         self._build_ui()
 
+        # Track whether the window is shown, so deferred preview work can
+        # wait while it is minimized
+        self._visible = True
+        self.root.bind("<Map>", self._on_map_change, add="+")
+        self.root.bind("<Unmap>", self._on_map_change, add="+")
+
     def _load_logo(self):
         """
         Load the main application logo from assets.
@@ -254,6 +299,7 @@ class Excel2ErpApp:
         # ─────────────────────────────────────────────────────────────
         src_frame = ttk.Frame(main)
         src_frame.pack(fill=tk.X, pady=4)
+        self._source_frame = src_frame  # The form frame is re-packed after it
 
         # Placeholder for source logo (updated when source is selected)
         self.source_logo_label = ttk.Label(src_frame)
@@ -268,7 +314,7 @@ class Excel2ErpApp:
         combo = ttk.Combobox(
             src_frame,
             textvariable=self.source_var,
-            values=[s.description for s in self.config.sources],
+            values=list(self._source_by_description),
             state="readonly",  # User can only select, not type
             width=40
         )
@@ -371,36 +417,69 @@ class Excel2ErpApp:
         detail_container.columnconfigure(0, weight=1)
         detail_container.rowconfigure(0, weight=1)
 
+        # Shown below the table only when rows beyond PREVIEW_LIMIT are hidden
+        self.show_all_btn = ttk.Button(
+            self.preview_frame,
+            command=self._show_remaining_rows
+        )
+
         # ─────────────────────────────────────────────────────────────
         # STATUS BAR: Feedback messages
         # ─────────────────────────────────────────────────────────────
         self.status_var = tk.StringVar()
         ttk.Label(main, textvariable=self.status_var).pack(anchor=tk.W, pady=(8, 0))
 
+    def _on_map_change(self, event):
+        """
+        Record whether the main window is mapped (not minimized).
+
+        Bindings on the root also see Map/Unmap events from child widgets,
+        so only the root's own events count.
+        """
+        if event.widget is self.root:
+            self._visible = event.type == tk.EventType.Map
+
     def _on_source_selected(self, event=None):
         """
         Handle source dropdown selection change.
 
+        Rapid successive selections (e.g. flicking through the list with
+        the keyboard) are coalesced: the form is rebuilt once, for the
+        last selection, SOURCE_SELECT_DELAY_MS after it was made.
+
+        Args:
+            event: The tkinter event (unused, but required for binding).
+        """
+        if self._source_after_id is not None:
+            self.root.after_cancel(self._source_after_id)
+        self._source_after_id = self.root.after(
+            SOURCE_SELECT_DELAY_MS, self._apply_source_selection
+        )
+
+    def _apply_source_selection(self):
+        """
+        Apply the current source dropdown selection.
+
         When the user selects a different source (vendor format):
         1. Clear any previously loaded data and reset to file picker mode
         2. Load and display the source's logo
         3. Identify missing properties for this source
         4. Create input widgets for each missing property
-
-        Args:
-            event: The tkinter event (unused, but required for binding).
         """
-        # Find the Source object matching the selected description
-        idx = self.source_var.get()
-        self.selected_source = next(
-            (s for s in self.config.sources if s.description == idx),
-            None
-        )
+        self._source_after_id = None
 
-        # Clear the dynamic form area
-        for widget in self.form_frame.winfo_children():
-            widget.destroy()
+        # Find the Source object matching the selected description
+        self.selected_source = self._source_by_description.get(self.source_var.get())
+
+        # Clear the dynamic form area by swapping in a fresh frame:
+        # destroying the old one takes all its children in one call and
+        # one geometry pass
+        old_form = self.form_frame
+        self.form_frame = ttk.Frame(old_form.master)
+        self.form_frame.pack(fill=tk.X, pady=8, after=self._source_frame)
+        old_form.destroy()
         self.field_widgets.clear()
+        self._value_getters.clear()
 
         # Reset to file picker mode (in case data was previously loaded)
         self._reset_to_file_picker()
@@ -411,27 +490,13 @@ class Excel2ErpApp:
             self.source_logo_image = None
             return
 
-        # Load and display source logo (scaled to ~64x64)
-        if self.selected_source.logo:
-            logo_path = (
-                self.basedir / "shared" / "fixtures" / "assets" /
-                self.selected_source.logo
-            )
-            if logo_path.exists():
-                # Load and scale the logo
-                self._source_logo_full = tk.PhotoImage(file=str(logo_path))
-                self.source_logo_image = self._source_logo_full.subsample(4, 4)
-                self.source_logo_label.config(image=self.source_logo_image)
-            else:
-                self.source_logo_label.config(image="")
-                self.source_logo_image = None
+        # Display source logo (scaled to ~64x64, decoded once per source)
+        self.source_logo_image = self._source_logo(self.selected_source)
+        self.source_logo_label.config(image=self.source_logo_image or "")
 
         # Determine which properties need user input
         # These are fields required in output but not extracted from Excel
-        self.missing_props = missing_properties(
-            self.selected_source,
-            self.config.result.header
-        )
+        self.missing_props = self._missing_by_source[self.selected_source.name]
 
         # Create input widgets for each missing property
         for prop in self.missing_props:
@@ -442,17 +507,41 @@ class Excel2ErpApp:
             ttk.Label(row, text=f"{prop.prompt}:", width=20).pack(side=tk.LEFT)
 
             # Create appropriate widget based on property type
+            # along with how to read its export value
             if prop.type == "date":
                 # Date properties get a calendar date picker
+                from tkcalendar import DateEntry
                 widget = DateEntry(row, width=27, date_pattern="yyyy-mm-dd")
                 widget.pack(side=tk.LEFT, padx=(8, 0))
+                # DateEntry returns a formatted string, normalize to YYYYMMDD
+                get_value = lambda w=widget: normalize_date(w.get())
             else:
                 # Everything else gets a text entry
                 widget = ttk.Entry(row, width=30)
                 widget.pack(side=tk.LEFT, padx=(8, 0))
+                get_value = widget.get
 
             # Store widget reference for later value retrieval
             self.field_widgets[prop.name] = widget
+            self._value_getters.append((prop.name, get_value))
+
+    def _source_logo(self, source: Source) -> tk.PhotoImage | None:
+        """
+        Return the scaled logo for a source, or None if it has none.
+
+        The PNG is read and subsampled the first time a source is selected;
+        switching back to it later reuses the cached image.
+        """
+        if source.name not in self._source_logos:
+            image = None
+            if source.logo:
+                logo_path = self.basedir / "shared" / "fixtures" / "assets" / source.logo
+                if logo_path.exists():
+                    # subsample(4, 4) takes every 4th pixel → 25% size; the
+                    # result is a separate image, so the full-size one can go
+                    image = tk.PhotoImage(file=str(logo_path)).subsample(4, 4)
+            self._source_logos[source.name] = image
+        return self._source_logos[source.name]
 
     def _on_action_click(self):
         """
@@ -482,6 +571,8 @@ class Excel2ErpApp:
         If a file is selected, it's stored and preview loading begins.
         If the user cancels, nothing happens.
         """
+        from tkinter import filedialog
+
         path = filedialog.askopenfilename(
             title="Select Excel File",
             filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")]
@@ -496,49 +587,120 @@ class Excel2ErpApp:
         Load Excel file, extract data, and display preview.
 
         This method:
-        1. Opens the Excel file with openpyxl
-        2. Extracts header data using the engine
-        3. Extracts detail data using the engine
-        4. Populates the preview treeviews
-        5. Switches to export mode (morphs the button)
-
-        On error, shows a message dialog and resets to file picker mode.
+        1. Disables the action button and shows a loading status
+        2. Starts a worker thread that opens the worksheet with
+           excel.open_sheet() and extracts header and detail data
+        3. Polls for the worker's result from the Tk event loop
+           (see _poll_load_result), which populates the preview and
+           switches to export mode
+
+        Parsing runs off the main thread so the window keeps repainting
+        during large loads; all widget updates stay on the main thread.
         """
         # Guard: Need both source and file
         if not self.selected_source or not self.selected_file:
             return
 
-        try:
-            # Show loading feedback
-            self.status_var.set("Loading...")
-            self.root.update()  # Force UI refresh
+        # Reopening an unchanged file for the same source reuses its data
+        key = self._load_key(self.selected_source, self.selected_file)
+        cached = self._load_cache.get(key)
+        if cached is not None:
+            self._load_cache.move_to_end(key)
+            header, detail = cached
+            # Copy the header: export merges user input into header_data.
+            # Detail rows are only read, so the cached list is shared.
+            self._apply_load(dict(header), detail)
+            return
 
-            # Open the Excel workbook (data_only=True to get values, not formulas)
-            wb = load_workbook(self.selected_file, data_only=True)
+        # Show loading feedback; the button stays disabled until the load ends
+        self.status_var.set("Loading...")
+        self.action_btn.state(["disabled"])
 
-            # Get the correct worksheet based on source config
-            sheet = wb.worksheets[self.selected_source.sheet_index]
+        result = queue.Queue(maxsize=1)
+        threading.Thread(
+            target=self._load_worker,
+            args=(self.selected_source, self.selected_file, result),
+            daemon=True
+        ).start()
+        self.root.after(50, self._poll_load_result, result, self.selected_source, self.selected_file, key)
 
-            # Extract data using domain functions
-            self.header_data = extract_header(
-                sheet,
-                self.selected_source,
-                self.config.result.header
-            )
-            self.detail_data = extract_detail(sheet, self.selected_source)
+    @staticmethod
+    def _load_key(source: Source, path: Path) -> tuple | None:
+        """
+        Identify a (source, file contents) pair for the load cache.
 
-            # Update UI with extracted data
-            self._show_preview()
-            self._set_export_mode()
+        Uses the file's modification time and size as a cheap proxy for its
+        contents. Returns None (never cached) if the file can't be stat'ed;
+        the load itself will then report the error.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return (source.name, str(path.resolve()), st.st_mtime_ns, st.st_size)
 
-            # Show success status
-            self.status_var.set(f"Loaded: {len(self.detail_data)} detail rows")
+    def _load_worker(self, source: Source, path: Path, result: queue.Queue):
+        """
+        Extract header and detail data from path (runs on a worker thread).
 
+        Touches no widgets; puts (header, detail, error) on result.
+        """
+        try:
+            # open_sheet() reads values only (not formulas), streams rows in
+            # read-only mode (or uses calamine when installed), copes with
+            # stale dimension tags, and closes the file when the block exits
+            with open_sheet(path, source.sheet_index) as sheet:
+                header = extract_header(sheet, source, self.config.result.header)
+                detail = extract_detail(sheet, source)
+            result.put((header, detail, None))
         except Exception as e:
+            result.put((None, None, e))
+
+    def _poll_load_result(self, result: queue.Queue, source: Source, path: Path, key: tuple | None):
+        """
+        Apply a finished load to the UI, or check again shortly.
+
+        Results for a source or file that is no longer selected (the user
+        switched sources while loading) are discarded.
+        """
+        try:
+            header, detail, error = result.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_load_result, result, source, path, key)
+            return
+
+        self.action_btn.state(["!disabled"])
+        if self.selected_source is not source or self.selected_file != path:
+            # Stale result: drop it, and the "Loading..." it left behind
+            self.status_var.set("")
+            return
+
+        if error is not None:
             # Show error and reset
             self.status_var.set("✗ Load error")
-            messagebox.showerror("Error", str(e))
+            from tkinter import messagebox
+            messagebox.showerror("Error", str(error))
             self._reset_to_file_picker()
+            return
+
+        if key is not None:
+            self._load_cache[key] = (dict(header), detail)
+            if len(self._load_cache) > LOAD_CACHE_SIZE:
+                self._load_cache.popitem(last=False)
+
+        self._apply_load(header, detail)
+
+    def _apply_load(self, header: dict[str, str], detail: list[dict[str, str]]):
+        """Show freshly loaded (or cached) data and switch to export mode."""
+        self.header_data = header
+        self.detail_data = detail
+
+        # Update UI with extracted data
+        self._show_preview()
+        self._set_export_mode()
+
+        # Show success status
+        self.status_var.set(f"Loaded: {len(self.detail_data)} detail rows")
 
     def _set_export_mode(self):
         """
@@ -594,41 +756,93 @@ class Excel2ErpApp:
         # Detail preview: Build table with dynamic columns
         if self.detail_data:
             # Get column names from first row
-            columns = list(self.detail_data[0].keys())
-            self.detail_tree["columns"] = columns
-
-            # Configure column headers and widths
-            for col in columns:
-                self.detail_tree.heading(col, text=col)
-                self.detail_tree.column(col, width=100, anchor=tk.W)
-
-            # Insert data rows
-            for row in self.detail_data:
-                values = [row.get(col, "") for col in columns]
-                self.detail_tree.insert("", tk.END, values=values)
+            columns = tuple(self.detail_data[0].keys())
+
+            # Configure column headers and widths, unless the previous file
+            # had the same columns (the usual case for a given source):
+            # reconfiguring makes Tk lay out the header row again
+            if columns != self._detail_columns:
+                self.detail_tree["columns"] = columns
+                for col in columns:
+                    self.detail_tree.heading(col, text=col)
+                    self.detail_tree.column(col, width=100, anchor=tk.W)
+                self._detail_columns = columns
+
+            # Insert the first PREVIEW_LIMIT rows in batches, yielding to the
+            # event loop between them (see _insert_detail_rows). The rest is
+            # offered on demand once this chain has finished.
+            self._preview_token = token = object()
+            self._insert_detail_rows(token, columns, 0, PREVIEW_LIMIT)
 
         # Update detail label with row count
         self.detail_label.config(
             text=f"{self.config.param('detailLabel')} ({len(self.detail_data)} rows)"
         )
 
+    def _show_remaining_rows(self):
+        """Insert the detail rows beyond PREVIEW_LIMIT into the preview."""
+        self.show_all_btn.pack_forget()
+        self._preview_token = token = object()
+        self._insert_detail_rows(
+            token, self._detail_columns, PREVIEW_LIMIT, len(self.detail_data)
+        )
+
+    def _insert_detail_rows(self, token: object, columns: tuple[str, ...],
+                            start: int, stop: int):
+        """
+        Insert one batch of detail_data[start:stop] into the preview, then
+        schedule the next.
+
+        Every row stays a real Treeview item, so scrolling, the scrollbar
+        and selection behave normally; only the insertion is spread over
+        several event-loop turns. A batch from a chain that is no longer
+        current (the preview was cleared or reloaded, even with the same
+        cached rows) does nothing. When a chain ends with rows still
+        hidden, the "show remaining" button is offered.
+        """
+        if token is not self._preview_token:
+            return
+
+        # Nothing is drawn while minimized; check back later instead
+        if not self._visible:
+            self.root.after(250, self._insert_detail_rows, token, columns, start, stop)
+            return
+
+        rows = self.detail_data
+        end = min(start + PREVIEW_BATCH_SIZE, stop, len(rows))
+        insert = self.detail_tree.insert
+        for row in rows[start:end]:
+            insert("", tk.END, values=[row.get(col, "") for col in columns])
+
+        if end < min(stop, len(rows)):
+            self.root.after(1, self._insert_detail_rows, token, columns, end, stop)
+            return
+
+        # Chain finished: only now can more rows be requested without two
+        # chains interleaving their inserts
+        self._preview_token = None
+        remaining = len(rows) - end
+        if remaining > 0:
+            self.show_all_btn.config(text=f"Show remaining {remaining} rows")
+            self.show_all_btn.pack(anchor=tk.W, pady=(4, 0))
+
     def _clear_tree_widgets(self):
         """
         Clear all data from the preview treeviews.
 
-        Removes all items from both header and detail trees,
-        and resets the detail tree's column configuration.
+        Removes all items from both header and detail trees. The detail
+        tree's columns are kept for reuse by the next preview.
         """
-        # Clear header tree items
-        for item in self.header_tree.get_children():
-            self.header_tree.delete(item)
-
-        # Clear detail tree items
-        for item in self.detail_tree.get_children():
-            self.detail_tree.delete(item)
+        # Delete all items of each tree in one Tcl call ("delete a b c ...")
+        # rather than one call per row
+        for tree in (self.header_tree, self.detail_tree):
+            children = tree.get_children()
+            if children:
+                tree.delete(*children)
 
-        # Reset columns (will be reconfigured on next preview)
-        self.detail_tree["columns"] = ()
+        # Nothing left to reveal; stop any preview chain still inserting
+        self.show_all_btn.pack_forget()
+        self._preview_token = None
 
     def _export(self):
         """
@@ -637,46 +851,24 @@ class Excel2ErpApp:
         This method:
         1. Collects values from user input widgets
         2. Merges them with extracted header data
-        3. Generates header and detail file contents
-        4. Creates the ZIP archive
-        5. Opens save dialog for user to choose location
-        6. Writes the ZIP and resets to file picker mode
+        3. Opens save dialog for user to choose location
+        4. Streams the ZIP (header and detail files) straight into that file
+        5. Resets to file picker mode
 
         On error, shows a message dialog but does NOT reset
         (user may want to fix input and retry).
         """
+        from tkinter import filedialog, messagebox
+
         try:
             # Merge user input into header data
-            for prop in self.missing_props:
-                widget = self.field_widgets[prop.name]
-
-                # Get value based on widget type
-                if prop.type == "date":
-                    # DateEntry returns formatted string, normalize to YYYYMMDD
-                    value = normalize_date(widget.get())
-                else:
-                    value = widget.get()
-
-                self.header_data[prop.name] = value
+            # (getters were chosen per widget type when the form was built)
+            for name, get_value in self._value_getters:
+                self.header_data[name] = get_value()
 
             # Add source name for use in filename template
             self.header_data["sourceName"] = self.selected_source.name
 
-            # Generate file contents using domain functions
-            header_content = generate_content(
-                self.config.result.header,
-                self.config.result.separator,
-                [self.header_data]  # Header is always a single record
-            )
-            detail_content = generate_content(
-                self.config.result.detail,
-                self.config.result.separator,
-                self.detail_data
-            )
-
-            # Create ZIP archive
-            zip_bytes = create_zip(header_content, detail_content, self.config.result)
-
             # Generate default filename using template
             zip_filename = expand(
                 self.config.result.base_name,
@@ -692,8 +884,19 @@ class Excel2ErpApp:
             )
 
             if output_path:
-                # User confirmed save - write file
-                Path(output_path).write_bytes(zip_bytes)
+                # User confirmed save - generate the files straight into the
+                # ZIP on disk, with no in-memory copy of the archive
+                try:
+                    write_zip(
+                        output_path,
+                        self.config.result,
+                        [self.header_data],  # Header is always a single record
+                        self.detail_data
+                    )
+                except BaseException:
+                    # Don't leave a truncated archive behind
+                    Path(output_path).unlink(missing_ok=True)
+                    raise
                 self.status_var.set(f"✓ Saved: {Path(output_path).name}")
 
                 # Reset to allow processing another file
@@ -18,6 +18,11 @@ These dataclasses are pure data containers with no business logic beyond simple
 accessors. They form the contract between the config parser and the extraction
 engine.
 
+All of them are frozen and use __slots__: a loaded configuration is read-only,
+and slot attributes are faster to read on the extraction hot path (prop.name,
+prop.compiled_replacements, ...) and smaller than per-instance __dict__s.
+Derived fields are filled in __post_init__ via object.__setattr__.
+
 STRUCTURE OVERVIEW:
 -------------------
 The configuration has three main sections:
@@ -39,10 +44,92 @@ The configuration supports multiple "sources" (different Excel formats from
 different vendors), but produces a single standardized output format.
 """
 
+import re
 from dataclasses import dataclass, field
 
+# Same ${name} syntax that engine.expand() understands
+_PLACEHOLDER_RE = re.compile(r"\$\{(\w+)\}")
+
+
+def to_format_template(template: str) -> str | None:
+    """
+    Translate a ${name} template into an equivalent str.format_map() template.
+
+    Literal braces are doubled so they survive formatting. Returns None when
+    a placeholder name is not a Python identifier (e.g. "${0}"), since
+    str.format would treat it as a positional index instead of a key.
+
+    Example:
+        to_format_template("${sourceName}_{${index}}") → "{sourceName}_{{{index}}}"
+    """
+    parts = _PLACEHOLDER_RE.split(template)
+    # split() alternates literal text (even slots) and placeholder names (odd slots)
+    if not all(name.isidentifier() for name in parts[1::2]):
+        return None
+    return "".join(
+        "{" + part + "}" if i % 2 else part.replace("{", "{{").replace("}", "}}")
+        for i, part in enumerate(parts)
+    )
+
+
+# Characters that give a replacement key regex meaning (anything else is literal)
+_REGEX_SPECIAL = frozenset(".^$*+?{}[]\\|()")
+
+
+def _can_overlap(a: str, b: str) -> bool:
+    """True if some placement of b overlapping a agrees on all shared characters."""
+    for shift in range(1 - len(b), len(a)):
+        lo, hi = max(0, shift), min(len(a), shift + len(b))
+        if a[lo:hi] == b[lo - shift:hi - shift]:
+            return True
+    return False
 
-@dataclass
+
+def literal_alternation(replacements: dict[str, str]) -> re.Pattern | None:
+    """
+    Combine literal replacement keys into one alternation pattern, if safe.
+
+    Applying N replacements one after another costs N scans of the value.
+    When every key is a plain string, a single scan over "k1|k2|..." with a
+    dictionary lookup per match gives the same result, provided that no step
+    can create or destroy a match for a later step. That holds when:
+
+    - there are at least two keys, all non-empty, with no regex metacharacters
+    - no two keys can overlap in any text (so matches never compete)
+    - no value can overlap a later key, and none contains a backslash
+      (nothing new to match, no group references)
+    - an empty value is only followed by single-character keys
+      (deleting text could otherwise join a longer key's pieces)
+
+    Returns None when any condition fails; callers then apply the compiled
+    patterns in order, exactly as configured.
+
+    Example:
+        literal_alternation({77086: 701987570207, 47086: 707271908503})
+        → re.compile("77086|47086")
+    """
+    keys = [str(k) for k in replacements]
+    values = [str(v) for v in replacements.values()]
+    if len(keys) < 2 or not all(keys):
+        return None
+    if any(_REGEX_SPECIAL.intersection(key) for key in keys):
+        return None
+
+    for i, key in enumerate(keys):
+        if any(_can_overlap(key, other) for other in keys[i + 1:]):
+            return None
+        value, later = values[i], keys[i + 1:]
+        if "\\" in value:
+            return None
+        if value == "" and any(len(k) > 1 for k in later):
+            return None
+        if any(_can_overlap(value, k) for k in later):
+            return None
+
+    return re.compile("|".join(re.escape(key) for key in keys))
+
+
+@dataclass(slots=True, frozen=True)
 class SourceProperty:
     """
     Defines how to extract a single property from an Excel sheet.
@@ -62,13 +149,53 @@ class SourceProperty:
                       Keys are regex patterns, values are replacement strings.
                       Example: {"^0+": ""} strips leading zeros.
                       Applied in iteration order (Python 3.7+ dict ordering).
+
+        coordinates: The header locator resolved to 1-based (row, column),
+                     filled in by the config loader so extraction never
+                     re-parses cell addresses. None for detail columns
+                     (and for properties built without it).
+
+        compiled_replacements: The replacements as (compiled pattern, replacement)
+                               pairs, derived once at construction so the
+                               extraction loop never re-parses a regex.
+                               Not a constructor argument.
+
+        literal_pattern: Single alternation over all keys when they are plain
+                         strings that can be applied in one pass (see
+                         literal_alternation()), else None. Paired with
+                         literal_map (key → replacement). Not constructor arguments.
     """
     name: str
     locator: str
     replacements: dict[str, str] = field(default_factory=dict)
+    coordinates: tuple[int, int] | None = None
+    compiled_replacements: list[tuple[re.Pattern, str]] = field(
+        init=False, repr=False, compare=False
+    )
+    literal_pattern: re.Pattern | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    literal_map: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-
-@dataclass
+    def __post_init__(self):
+        """Compile replacement patterns once, in configuration order."""
+        # str() handles YAML edge cases such as numeric keys (77086: ...)
+        # Frozen dataclass: derived fields are set through object.__setattr__
+        object.__setattr__(self, "compiled_replacements", [
+            (re.compile(str(pattern)), str(replacement))
+            for pattern, replacement in self.replacements.items()
+        ])
+        literal_pattern = literal_alternation(self.replacements)
+        if literal_pattern is not None:
+            object.__setattr__(self, "literal_pattern", literal_pattern)
+            object.__setattr__(self, "literal_map", {
+                str(k): str(v) for k, v in self.replacements.items()
+            })
+
+
+@dataclass(slots=True, frozen=True)
 class DetailConfig:
     """
     Configuration for extracting the detail table (line items).
@@ -89,13 +216,25 @@ class DetailConfig:
                    If the first column contains this value, reading stops.
                    Example: "TOTAL" to stop before a summary row.
                    If None, reading stops at the first empty row.
+
+        coordinates: The locator resolved to 1-based (row, column),
+                     filled in by the config loader. None if not resolved.
+
+        column_map: Excel column header → SourceProperty, built once from
+                    properties. Not a constructor argument.
     """
     locator: str
     properties: list[SourceProperty]
     end_value: str | None = None
+    coordinates: tuple[int, int] | None = None
+    column_map: dict[str, SourceProperty] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Index properties by column header once, for extraction."""
+        object.__setattr__(self, "column_map", {p.locator: p for p in self.properties})
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Source:
     """
     Complete extraction configuration for one type of Excel file.
@@ -136,7 +275,7 @@ class Source:
     default_values: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResultProperty:
     """
     Defines one column in an output file.
@@ -159,19 +298,28 @@ class ResultProperty:
         default_value: Value to use if not provided by extraction or user input.
                        Can contain ${placeholder} syntax for expansion.
                        Example: "${sourceName}_${index}" for auto-generated IDs.
+
+        default_format: default_value pre-translated for str.format_map(), or
+                        None when it has no placeholders. Derived, not configured.
     """
     name: str
     type: str = "text"
     prompt: str | None = None
     default_value: str | None = None
+    default_format: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Set prompt to name if not explicitly provided."""
+        """Set prompt to name if not explicitly provided; prebuild default template."""
         if self.prompt is None:
-            self.prompt = self.name
+            object.__setattr__(self, "prompt", self.name)
+        # Translate once here so generate_content() avoids a regex pass per record
+        if self.default_value and "${" in str(self.default_value):
+            object.__setattr__(
+                self, "default_format", to_format_template(str(self.default_value))
+            )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FileSpec:
     """
     Specification for one output file (header or detail).
@@ -194,25 +342,34 @@ class FileSpec:
 
         epilog: Optional text appended to the file (after data lines).
                 Useful for file footers or checksums.
+
+        default_values: Property name → default_value for the properties
+                        that define one. Derived, not a constructor argument.
     """
     filename: str
     properties: list[ResultProperty]
     prolog: str = ""
     epilog: str = ""
 
-    @property
-    def default_values(self) -> dict[str, str]:
+    default_values: dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
         """
         Collect default values from all properties in this file spec.
 
-        Returns a dictionary of property name → default value for all
+        Builds a dictionary of property name → default value for all
         properties that have a default_value defined. Used as the base
         layer in the value resolution hierarchy.
+
+        Computed once here rather than on every access; properties are
+        not expected to change after the configuration is loaded.
         """
-        return {p.name: p.default_value for p in self.properties if p.default_value}
+        object.__setattr__(self, "default_values", {
+            p.name: p.default_value for p in self.properties if p.default_value
+        })
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResultConfig:
     """
     Configuration for output file generation.
@@ -237,7 +394,7 @@ class ResultConfig:
     detail: FileSpec
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Config:
     """
     Top-level application configuration.
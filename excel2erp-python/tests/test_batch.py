@@ -0,0 +1,55 @@
+"""
+Tests for batch.py - headless and parallel conversion.
+"""
+
+import io
+import zipfile
+
+import pytest
+from config import load_config
+from batch import process_workbook, process_workbooks
+
+
+def read_entries(data: bytes) -> dict[str, str]:
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        return {name: zf.read(name).decode("utf-8") for name in zf.namelist()}
+
+
+class TestProcessWorkbook:
+    def test_builds_zip_with_header_and_detail(self, config_path, sample_excel):
+        config = load_config(str(config_path))
+
+        entries = read_entries(process_workbook(sample_excel, config, "el-dorado"))
+
+        assert set(entries) == {config.result.header.filename, config.result.detail.filename}
+        assert entries[config.result.detail.filename]
+
+    def test_normalizes_date_inputs(self, config_path, sample_excel):
+        config = load_config(str(config_path))
+        source = next(s for s in config.sources if s.name == "el-dorado")
+        date_props = [p for p in config.result.header.properties
+                      if p.type == "date" and p.name not in {h.name for h in source.header}]
+        if not date_props:
+            pytest.skip("no user-supplied date field in config")
+
+        inputs = {date_props[0].name: "2024-12-15"}
+        entries = read_entries(process_workbook(sample_excel, config, "el-dorado", inputs))
+
+        assert "20241215" in entries[config.result.header.filename]
+
+    def test_unknown_source(self, config_path, sample_excel):
+        config = load_config(str(config_path))
+
+        with pytest.raises(KeyError):
+            process_workbook(sample_excel, config, "no-such-source")
+
+
+class TestProcessWorkbooks:
+    def test_matches_sequential_results_in_order(self, config_path, sample_excel):
+        config = load_config(str(config_path))
+        paths = [sample_excel, str(sample_excel)]
+
+        results = process_workbooks(paths, config, "el-dorado", max_workers=2)
+
+        expected = process_workbook(sample_excel, config, "el-dorado")
+        assert [read_entries(r) for r in results] == [read_entries(expected)] * 2
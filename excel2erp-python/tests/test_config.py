@@ -4,6 +4,7 @@ Tests for config.py - YAML loading.
 
 import pytest
 from config import load_config
+from excel import parse_cell_address
 
 
 class TestLoadConfig:
@@ -24,6 +25,16 @@ class TestLoadConfig:
         assert len(source.header) > 0
         assert source.detail.locator
 
+    def test_resolves_locators_to_coordinates(self, config_path):
+        config = load_config(str(config_path))
+
+        for source in config.sources:
+            assert source.detail.coordinates == parse_cell_address(source.detail.locator)
+            for prop in source.header:
+                assert prop.coordinates == parse_cell_address(prop.locator)
+            # Detail locators are column names, not cell addresses
+            assert all(p.coordinates is None for p in source.detail.properties)
+
     def test_parses_result_config(self, config_path):
         config = load_config(str(config_path))
 
@@ -59,3 +70,18 @@ class TestLoadConfig:
                 if prop.replacements:
                     assert isinstance(prop.replacements, dict)
                     return
+
+    def test_memoizes_unchanged_file(self, config_path):
+        assert load_config(str(config_path)) is load_config(str(config_path))
+
+    def test_reloads_modified_file(self, config_path, tmp_path):
+        copy = tmp_path / "excel2erp.yaml"
+        text = config_path.read_text(encoding="utf-8")
+        copy.write_text(text, encoding="utf-8")
+        first = load_config(str(copy))
+
+        copy.write_text(text.replace("name: pedidos", "name: orders", 1),
+                        encoding="utf-8")
+
+        assert load_config(str(copy)).name == "orders"
+        assert first.name == "pedidos"
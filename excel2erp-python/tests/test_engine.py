@@ -11,9 +11,9 @@ from openpyxl import load_workbook
 
 from config import load_config
 from engine import (
-    apply_replacements, extract_header, extract_detail,
+    apply_replacements, extract_header, extract_detail, iter_detail,
     missing_properties, expand, normalize_date,
-    generate_content, create_zip
+    generate_content, create_zip, write_zip
 )
 from model import SourceProperty, ResultProperty, FileSpec
 
@@ -31,6 +31,15 @@ class TestApplyReplacements:
         prop = SourceProperty(name="x", locator="A1", replacements={"-": "", " ": ""})
         assert apply_replacements("12-34 56", prop) == "123456"
 
+    def test_literal_codes_single_pass(self):
+        prop = SourceProperty(
+            name="x", locator="A1",
+            replacements={77086: 701987570207, 47086: 707271908503}
+        )
+        assert prop.literal_pattern is not None
+        assert apply_replacements("77086", prop) == "701987570207"
+        assert apply_replacements("47086/77086", prop) == "707271908503/701987570207"
+
 
 class TestExpand:
     def test_simple_expansion(self):
@@ -42,6 +51,11 @@ class TestExpand:
     def test_no_placeholders(self):
         assert expand("plain text", {}) == "plain text"
 
+    def test_non_placeholders_left_alone(self):
+        props = {"a": "X", "n": 7}
+        assert expand("${} ${a-b} ${a ${a}", props) == "${} ${a-b} ${a X"
+        assert expand("${n}${unclosed", props) == "7${unclosed"
+
 
 class TestNormalizeDate:
     def test_removes_separators(self):
@@ -52,6 +66,10 @@ class TestNormalizeDate:
     def test_already_normalized(self):
         assert normalize_date("20240115") == "20240115"
 
+    def test_strips_other_non_digits(self):
+        assert normalize_date("2024-01-15T10:30") == "202401151030"
+        assert normalize_date("---") == ""
+
 
 class TestMissingProperties:
     def test_finds_properties_not_in_source(self, config_path):
@@ -68,6 +86,15 @@ class TestMissingProperties:
             assert prop.name not in extracted_names
             assert prop.name not in defaulted_names
 
+    def test_repeated_calls_return_fresh_equal_lists(self, config_path):
+        config = load_config(str(config_path))
+        source = config.sources[0]
+
+        first = missing_properties(source, config.result.header)
+        first.clear()
+
+        assert missing_properties(source, config.result.header) != []
+
 
 class TestGenerateContent:
     def test_simple_output(self):
@@ -120,6 +147,31 @@ class TestGenerateContent:
 
         assert content == "0\n1\n2"
 
+    def test_default_template_matches_expand(self):
+        spec = FileSpec(
+            filename="test.txt",
+            properties=[
+                ResultProperty(name="id", default_value="{${code}}-${index}-${missing}"),
+            ]
+        )
+        records = [{"code": "A"}, {"code": "B"}]
+        content = generate_content(spec, ";", records)
+
+        assert content == "{A}-0-\n{B}-1-"
+
+    def test_placeholders_in_record_values(self):
+        spec = FileSpec(
+            filename="test.txt",
+            properties=[
+                ResultProperty(name="ref"),
+                ResultProperty(name="line", default_value="${index}"),
+            ]
+        )
+        records = [{"code": "A", "ref": "${code}/${index}"}, {"code": "B", "ref": "x"}]
+        content = generate_content(spec, ";", records)
+
+        assert content == "A/0;0\nx;1"
+
 
 class TestCreateZip:
     def test_creates_valid_zip(self, config_path):
@@ -140,6 +192,36 @@ class TestCreateZip:
             assert zf.read(config.result.header.filename).decode() == header_content
             assert zf.read(config.result.detail.filename).decode() == detail_content
 
+    def test_small_entries_stored_large_deflated(self, config_path):
+        config = load_config(str(config_path))
+        zip_bytes = create_zip("header;content", "detail;line\n" * 1000, config.result)
+
+        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+            assert zf.getinfo(config.result.header.filename).compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo(config.result.detail.filename).compress_type == zipfile.ZIP_DEFLATED
+
+    @pytest.mark.parametrize("lines", [2, 2000])
+    def test_write_zip_matches_create_zip(self, config_path, lines):
+        config = load_config(str(config_path))
+        header = [{"customerCode": "C1", "date": "20240101", "orderNumber": "ñ-1"}]
+        detail = [{"productCode": f"P{i}", "quantity": "2"} for i in range(lines)]
+
+        expected = create_zip(
+            generate_content(config.result.header, config.result.separator, header),
+            generate_content(config.result.detail, config.result.separator, detail),
+            config.result,
+        )
+        buffer = io.BytesIO()
+        write_zip(buffer, config.result, header, iter(detail))
+
+        with zipfile.ZipFile(io.BytesIO(expected)) as want, zipfile.ZipFile(buffer) as got:
+            assert got.namelist() == want.namelist()
+            for name in want.namelist():
+                assert got.read(name) == want.read(name)
+                # Same compression and no ZIP64 marking (create_version 4.5)
+                assert got.getinfo(name).compress_type == want.getinfo(name).compress_type
+                assert got.getinfo(name).create_version == want.getinfo(name).create_version
+
 
 class TestExtraction:
     """Integration tests using actual Excel fixtures."""
@@ -170,6 +252,30 @@ class TestExtraction:
         assert len(detail) > 0
         assert all(isinstance(row, dict) for row in detail)
 
+    def test_iter_detail_is_lazy_extract_detail(self, config_path, sample_excel):
+        config = load_config(str(config_path))
+        source = config.sources[0]
+        sheet = load_workbook(sample_excel, data_only=True).worksheets[source.sheet_index]
+
+        rows = iter_detail(sheet, source)
+
+        assert not isinstance(rows, list)
+        assert list(rows) == extract_detail(sheet, source)
+
+    def test_read_only_extraction_matches_regular(self, config_path, sample_excel):
+        config = load_config(str(config_path))
+        source = config.sources[0]
+
+        regular = load_workbook(sample_excel, data_only=True).worksheets[source.sheet_index]
+        wb = load_workbook(sample_excel, data_only=True, read_only=True)
+        try:
+            sheet = wb.worksheets[source.sheet_index]
+            assert extract_header(sheet, source, config.result.header) == \
+                extract_header(regular, source, config.result.header)
+            assert extract_detail(sheet, source) == extract_detail(regular, source)
+        finally:
+            wb.close()
+
 
 class TestParity:
     """
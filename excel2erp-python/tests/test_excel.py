@@ -3,7 +3,11 @@ Tests for excel.py - cell parsing and table reading.
 """
 
 import pytest
-from excel import parse_cell_address, cell_to_string, read_table
+from excel import (
+    parse_cell_address, cell_to_string, value_to_string,
+    read_cells, read_table, read_table_rows, open_sheet
+)
+import excel
 from datetime import datetime, date
 
 
@@ -52,6 +56,13 @@ class TestCellToString:
             value = 3.14
         assert cell_to_string(MockCell()) == "3.14"
 
+    def test_non_finite_float_preserved(self):
+        class MockCell:
+            value = float("nan")
+        assert cell_to_string(MockCell()) == "nan"
+        MockCell.value = float("-inf")
+        assert cell_to_string(MockCell()) == "-inf"
+
     def test_datetime_formatted(self):
         class MockCell:
             value = datetime(2024, 1, 15, 10, 30)
@@ -62,6 +73,21 @@ class TestCellToString:
             value = date(2024, 1, 15)
         assert cell_to_string(MockCell()) == "20240115"
 
+    def test_subclasses_take_slow_path(self):
+        class Stamp(datetime):
+            pass
+
+        class Amount(float):
+            pass
+
+        class MockCell:
+            value = Stamp(2024, 1, 15)
+        assert cell_to_string(MockCell()) == "20240115"
+        MockCell.value = Amount(7.0)
+        assert cell_to_string(MockCell()) == "7"
+        MockCell.value = True
+        assert cell_to_string(MockCell()) == "True"
+
 
 class TestReadTable:
     def test_reads_from_excel_file(self, sample_excel):
@@ -76,3 +102,85 @@ class TestReadTable:
         assert isinstance(rows, list)
         if rows:
             assert isinstance(rows[0], dict)
+
+    def test_read_only_matches_regular_workbook(self, sample_excel):
+        from openpyxl import load_workbook
+
+        regular = load_workbook(sample_excel, data_only=True).worksheets[0]
+        read_only = load_workbook(sample_excel, data_only=True, read_only=True)
+
+        try:
+            assert read_table(read_only.worksheets[0], "A8") == read_table(regular, "A8")
+        finally:
+            read_only.close()
+
+
+class TestReadTableRows:
+    def test_rows_align_with_read_table(self, sample_excel):
+        from openpyxl import load_workbook
+
+        sheet = load_workbook(sample_excel, data_only=True).worksheets[0]
+        headers, rows = read_table_rows(sheet, "A8")
+
+        assert [dict(zip(headers, map(value_to_string, row))) for row in rows] == read_table(sheet, "A8")
+
+    def test_no_header(self, sample_excel):
+        from openpyxl import load_workbook
+
+        sheet = load_workbook(sample_excel, data_only=True).worksheets[0]
+        assert read_table_rows(sheet, "ZZ500") == ([], [])
+
+
+class TestReadCells:
+    def test_reads_scattered_cells_in_order(self, sample_excel):
+        from openpyxl import load_workbook
+
+        sheet = load_workbook(sample_excel, data_only=True).worksheets[0]
+        coordinates = [(3, 5), (2, 5), (8, 1)]
+
+        assert read_cells(sheet, coordinates) == [
+            cell_to_string(sheet.cell(row, col)) for row, col in coordinates
+        ]
+
+    def test_cells_beyond_data_are_empty(self, sample_excel):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(sample_excel, data_only=True, read_only=True)
+        try:
+            assert read_cells(wb.worksheets[0], [(10000, 1)]) == [""]
+        finally:
+            wb.close()
+
+    def test_no_coordinates(self):
+        assert read_cells(None, []) == []
+
+
+class TestOpenSheet:
+    def test_readers_agree(self, sample_excel, monkeypatch):
+        with open_sheet(sample_excel, 0) as sheet:
+            preferred = read_table(sheet, "A8")
+
+        # Force the openpyxl fallback, as when python-calamine is not installed
+        monkeypatch.setattr(excel, "CalamineWorkbook", None)
+        with open(sample_excel, "rb") as f, open_sheet(f, 0) as sheet:
+            assert read_table(sheet, "A8") == preferred
+
+    def test_ignores_stale_dimension_tag(self, sample_excel, monkeypatch, tmp_path):
+        import re
+        import zipfile
+
+        with open_sheet(sample_excel, 0) as sheet:
+            expected = read_table(sheet, "A8")
+
+        # Rewrite the sheet's <dimension> as "A1:A1", as some writers do
+        stale = tmp_path / "stale.xlsx"
+        with zipfile.ZipFile(sample_excel) as src, zipfile.ZipFile(stale, "w") as dst:
+            for item in src.infolist():
+                data = src.read(item)
+                if item.filename.startswith("xl/worksheets/sheet"):
+                    data = re.sub(rb'<dimension ref="[^"]*"', b'<dimension ref="A1:A1"', data)
+                dst.writestr(item, data)
+
+        monkeypatch.setattr(excel, "CalamineWorkbook", None)
+        with open_sheet(stale, 0) as sheet:
+            assert read_table(sheet, "A8") == expected
@@ -2,6 +2,10 @@
 Tests for model.py - dataclass definitions.
 """
 
+import dataclasses
+
+import pytest
+
 from model import (
     SourceProperty, DetailConfig, Source, ResultProperty,
     FileSpec, ResultConfig, Config
@@ -23,6 +27,43 @@ class TestSourceProperty:
         )
         assert prop.replacements == {"^0+": "", "-": ""}
 
+    def test_replacements_compiled_once(self):
+        # YAML may yield numeric keys/values, e.g. 77086: 701987570207
+        prop = SourceProperty(name="code", locator="B2", replacements={77086: 701987570207})
+        [(pattern, replacement)] = prop.compiled_replacements
+        assert pattern.pattern == "77086"
+        assert replacement == "701987570207"
+
+    def test_literal_keys_folded_into_one_pattern(self):
+        prop = SourceProperty(
+            name="code", locator="Cod.",
+            replacements={77086: 701987570207, 47086: 707271908503}
+        )
+        assert prop.literal_pattern.pattern == "77086|47086"
+        assert prop.literal_map == {"77086": "701987570207", "47086": "707271908503"}
+
+    def test_order_dependent_keys_not_folded(self):
+        # "ab" → "c" then "cd" → "x" turns "abd" into "x"; one pass would give "cd"
+        prop = SourceProperty(name="code", locator="B2", replacements={"ab": "c", "cd": "x"})
+        assert prop.literal_pattern is None
+        assert SourceProperty(name="d", locator="B2", replacements={"^0+": "", "-": ""}).literal_pattern is None
+
+
+class TestImmutability:
+    def test_config_objects_are_frozen_and_slotted(self):
+        prop = ResultProperty(name="a")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            prop.name = "b"
+        assert not hasattr(prop, "__dict__")
+
+
+class TestDetailConfig:
+    def test_column_map_indexes_properties_by_locator(self):
+        qty = SourceProperty(name="Quantity", locator="Cant.")
+        code = SourceProperty(name="ItemCode", locator="Cod.")
+        detail = DetailConfig(locator="A8", properties=[code, qty])
+        assert detail.column_map == {"Cod.": code, "Cant.": qty}
+
 
 class TestResultProperty:
     def test_prompt_defaults_to_name(self):
@@ -37,6 +78,11 @@ class TestResultProperty:
         prop = ResultProperty(name="field")
         assert prop.type == "text"
 
+    def test_default_format_prebuilt(self):
+        prop = ResultProperty(name="id", default_value="{${code}}_${index}")
+        assert prop.default_format == "{{{code}}}_{index}"
+        assert ResultProperty(name="x", default_value="plain").default_format is None
+
 
 class TestFileSpec:
     def test_default_values_extracts_from_properties(self):